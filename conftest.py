@@ -1,31 +1,45 @@
 # conftest.py
 import os
-import configparser
+import functools
+import types
 import pytest
 import logging
 from pathlib import Path
-from typing import Dict
-import time
+from typing import Dict, Mapping
 import logging
 from typing import Any
 
-from utils.driver_factory import create_selenium_driver
+from utils.driver_factory import REUSE_ENV, create_selenium_driver, stop_shared_chrome
 from libs.common import screenshot_bytes_from_selenium
+from libs.fast_config import FastConfigParser
+from libs.retrier import Retrier
 
 # Path to config.ini (adjust if you keep config elsewhere)
 CONFIG_PATH = Path(__file__).parent / "config.ini"
 
+# Set once the [llm] env vars have been exported for this process.
+_LLM_APPLIED = False
+
 logger = logging.getLogger("framework.alumnium_patch")
 
+
+@functools.cache
+def _planner_agent_cls():
+    """Import Alumnium's PlannerAgent once per process."""
+    from alumnium.server.agents.planner_agent import PlannerAgent
+    return PlannerAgent
+
+
 def patch_alumnium_planner_invoke(max_retries: int = 3, retry_backoff: float = 5.0, total_timeout: float = 60.0):
     """
     Monkey-patch Alumnium's PlannerAgent.invoke to retry when the underlying
     _invoke_chain returns None (or otherwise malformed message) which would
     otherwise cause AttributeError on message.content.
+    Safe to call repeatedly: the patch is only installed once per process.
     """
     try:
         # import the PlannerAgent class from the installed package
-        from alumnium.server.agents.planner_agent import PlannerAgent
+        PlannerAgent = _planner_agent_cls()
     except Exception as exc:
         logger.debug("Could not import PlannerAgent to patch it: %s", exc)
         return
@@ -36,142 +50,170 @@ def patch_alumnium_planner_invoke(max_retries: int = 3, retry_backoff: float = 5
         logger.debug("PlannerAgent.invoke not found; nothing to patch.")
         return
 
+    if getattr(original_invoke, "_alumnium_patched", False):
+        logger.debug("PlannerAgent.invoke already patched; skipping.")
+        return
+
+    # retry plan built once and shared by every call
+    retrier = Retrier.exponential(
+        total_timeout,
+        max_retries,
+        retry_backoff,
+        logger=logger,
+    )
+
     def safe_invoke(self, goal: str, accessibility_tree_xml: str):
         """Wrapped invoke with retries and None-safety."""
-        start = time.monotonic()
-        attempt = 0
-        backoff = float(retry_backoff)
-
-        while True:
-            attempt += 1
-            elapsed = time.monotonic() - start
-            if elapsed > float(total_timeout):
-                msg = f"PlannerAgent.invoke: total timeout {total_timeout}s exceeded after {attempt-1} attempts"
-                logger.error(msg)
-                raise TimeoutError(msg)
-
-            try:
-                # call original _invoke_chain logic through the original method body
-                message = original_invoke(self, goal, accessibility_tree_xml)
-            except Exception as exc:
-                logger.warning("PlannerAgent.invoke attempt %d raised: %s", attempt, exc, exc_info=True)
-                if attempt >= int(max_retries):
-                    logger.error("PlannerAgent.invoke exhausted retries (%d) after exception", max_retries)
-                    raise
-                time.sleep(backoff)
-                backoff *= 2
-                continue
-
-            # if the original returns None (or a falsy message), retry
-            if message is None:
-                logger.warning("PlannerAgent.invoke attempt %d returned None for goal=%r — retrying", attempt, goal)
-                if attempt >= int(max_retries):
-                    raise RuntimeError(f"PlannerAgent.invoke returned None after {max_retries} attempts for goal: {goal}")
-                time.sleep(backoff)
-                backoff *= 2
-                continue
-
-            # Defensive: if message lacks expected fields, try to recover or fail with clear error
-            # Some code paths expect message.content or message['parsed']
-            try:
-                # if message is dict-like and has 'parsed' or 'content', return as-is
-                if isinstance(message, dict) or hasattr(message, "__getitem__"):
-                    return message
-                # if it has content attribute, return it (normal case)
-                if hasattr(message, "content") or hasattr(message, "parsed") or hasattr(message, "raw"):
-                    return message
-            except Exception:
-                # fall-through to returning message if it looks non-None
-                return message
-
-            # fallback - return message
-            return message
-
-    # install the wrapper
+        # call original _invoke_chain logic through the original method body; None -> retry
+        return retrier.run(f"PlannerAgent.invoke(goal={goal!r})", original_invoke, self, goal, accessibility_tree_xml)
+
+    # install the wrapper (flag it so a second call doesn't stack another retry loop)
+    safe_invoke._alumnium_patched = True
     setattr(PlannerAgent, "invoke", safe_invoke)
     logger.info("Patched Alumnium PlannerAgent.invoke to be None-safe with retries: max_retries=%s backoff=%s total_timeout=%s",
                 max_retries, retry_backoff, total_timeout)
 
-def _apply_llm_config_from_cfg(cfg: configparser.ConfigParser, section_name: str = "llm") -> Dict[str, str]:
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime_ns: int) -> Mapping[str, Mapping[str, str]]:
     """
-    Read the [llm] section from config.ini and set the env vars Alumnium expects.
-    Supported provider: 'ollama'. Sets:
-      - ALUMNIUM_MODEL = "ollama"
-      - ALUMNIUM_OLLAMA_URL = <ollama_url> (if provided)
-      - ALUMNIUM_OLLAMA_MODEL = <model> (optional)
-    Returns the dict of llm values read (may be empty).
+    Parse config.ini once per (path, mtime) and return a read-only view of its sections.
+    Editing the file changes mtime_ns, which forces a fresh parse.
     """
-    if section_name not in cfg:
-        return {}
+    parsed = FastConfigParser().read(path).as_dict()
+    return types.MappingProxyType({name: types.MappingProxyType(values) for name, values in parsed.items()})
+
+
+def _load_config() -> Mapping[str, Mapping[str, str]]:
+    """Cached config.ini sections; a missing file yields just an empty DEFAULT, as ConfigParser.read did."""
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _load_config_cached(str(CONFIG_PATH), mtime_ns)
+
+
+def _set_llm_env_once(llm_cfg: Mapping[str, str]) -> None:
+    """Export the env vars Alumnium expects; only the first call per process has any effect."""
+    global _LLM_APPLIED
+    if _LLM_APPLIED:
+        return
+    _LLM_APPLIED = True
 
-    llm_cfg = dict(cfg[section_name])
     provider = llm_cfg.get("provider", "").strip().lower()
     ollama_url = llm_cfg.get("ollama_url", "").strip()
     model = llm_cfg.get("model", "").strip()
 
+    desired = {}
     if provider == "ollama":
-        os.environ.setdefault("ALUMNIUM_MODEL", "ollama")
+        desired["ALUMNIUM_MODEL"] = "ollama"
         if ollama_url:
-            os.environ.setdefault("ALUMNIUM_OLLAMA_URL", ollama_url)
+            desired["ALUMNIUM_OLLAMA_URL"] = ollama_url
         if model:
-            os.environ.setdefault("ALUMNIUM_OLLAMA_MODEL", model)
+            desired["ALUMNIUM_OLLAMA_MODEL"] = model
     else:
         # Generic fallback mapping
         if provider:
-            os.environ.setdefault("ALUMNIUM_MODEL", provider)
+            desired["ALUMNIUM_MODEL"] = provider
         if model:
-            os.environ.setdefault("ALUMNIUM_MODEL_NAME", model)
+            desired["ALUMNIUM_MODEL_NAME"] = model
 
     # non-secret flag for diagnostics
-    os.environ.setdefault("ALUMNIUM_LLM_CONFIGURED", "true" if provider else "false")
-    return llm_cfg
+    desired["ALUMNIUM_LLM_CONFIGURED"] = "true" if provider else "false"
 
+    # single pass; values already present in the environment win
+    _set = os.environ.setdefault
+    for key, value in desired.items():
+        _set(key, value)
 
-@pytest.fixture(scope="session")
-def config():
+
+def _apply_llm_config_from_cfg(cfg: Mapping[str, Mapping[str, str]], section_name: str = "llm") -> Mapping[str, str]:
     """
-    Load config.ini, apply LLM config early (so env vars are present prior to Alumnium import),
-    and return a merged dict of DEFAULT + chosen environment section.
+    Read the [llm] section from config.ini and set the env vars Alumnium expects.
+    Supported provider: 'ollama'. Sets:
+      - ALUMNIUM_MODEL = "ollama"
+      - ALUMNIUM_OLLAMA_URL = <ollama_url> (if provided)
+      - ALUMNIUM_OLLAMA_MODEL = <model> (optional)
+    Returns a read-only mapping of the llm values read (may be empty).
     """
-    cfg = configparser.ConfigParser()
-    cfg.read(CONFIG_PATH)
+    if section_name not in cfg:
+        return types.MappingProxyType({})
 
-    # Apply LLM config BEFORE anything that may import Alumnium runs.
-    llm_config = _apply_llm_config_from_cfg(cfg, section_name="llm")
+    llm_cfg = types.MappingProxyType(dict(cfg[section_name]))
+    _set_llm_env_once(llm_cfg)
+    return llm_cfg
 
+
+def _build_env_config(cfg: Mapping[str, Mapping[str, str]]) -> Dict[str, Any]:
+    """Merge DEFAULT + the section selected by $ENV and normalise value types."""
     env = os.getenv("ENV", cfg["DEFAULT"].get("environment", "local"))
     env_cfg = dict(cfg["DEFAULT"])
     if env in cfg:
         env_cfg.update(dict(cfg[env]))
 
-    # Normalise types and include llm sub-dict
     env_cfg["headless"] = str(env_cfg.get("headless", "true")).lower() == "true"
     env_cfg["implicit_wait"] = int(env_cfg.get("implicit_wait", 5))
+    env_cfg["disable_images"] = str(env_cfg.get("disable_images", "false")).lower() == "true"
     # Optional robustness params (defaults)
     env_cfg["timeout_seconds"] = int(env_cfg.get("timeout_seconds", 60))
     env_cfg["max_retries"] = int(env_cfg.get("max_retries", 3))
     env_cfg["retry_backoff"] = float(env_cfg.get("retry_backoff", 5))
-    env_cfg["llm"] = llm_config
+    return env_cfg
 
-    # inside your config() fixture in conftest.py, after reading CONFIG_PATH and applying llm env vars:
-    llm_cfg = _apply_llm_config_from_cfg(cfg, section_name="llm")
-    # read robustness settings (defaults if missing)
-    max_retries = int(cfg["DEFAULT"].get("max_retries", 3))
-    retry_backoff = float(cfg["DEFAULT"].get("retry_backoff", 5))
-    timeout_seconds = float(cfg["DEFAULT"].get("timeout_seconds", 60))
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--disable-images",
+        action="store_true",
+        default=False,
+        help="Start Chrome with images disabled (for runs such as the DuckDuckGo search test that don't need them).",
+    )
 
 
-    patch_alumnium_planner_invoke(max_retries=max_retries, retry_backoff=retry_backoff, total_timeout=timeout_seconds)
+def pytest_configure(config):
+    """
+    One-time setup before collection: export the LLM env vars and patch
+    Alumnium's PlannerAgent.invoke with the retry settings from config.ini.
+    """
+    cfg = _load_config()
 
+    # Apply LLM config BEFORE anything that may import Alumnium runs.
+    _apply_llm_config_from_cfg(cfg, section_name="llm")
+
+    env_cfg = _build_env_config(cfg)
+    patch_alumnium_planner_invoke(
+        max_retries=env_cfg["max_retries"],
+        retry_backoff=env_cfg["retry_backoff"],
+        total_timeout=env_cfg["timeout_seconds"],
+    )
+
+
+@pytest.fixture(scope="session")
+def config():
+    """
+    Load config.ini and return a merged dict of DEFAULT + chosen environment section,
+    with the [llm] section under the "llm" key.
+    """
+    cfg = _load_config()
+
+    env_cfg = _build_env_config(cfg)
+    env_cfg["llm"] = _apply_llm_config_from_cfg(cfg, section_name="llm")
     return env_cfg
 
 
 @pytest.fixture(scope="session")
-def driver(config):
+def driver(request, config):
     """Create a Selenium driver for the session and yield it."""
     headless = config.get("headless", True)
     implicit_wait = config.get("implicit_wait", 5)
-    _, drv, cleanup = create_selenium_driver(headless=headless, implicit_wait=implicit_wait)
+    # images stay on unless explicitly disabled for a run that doesn't need them
+    disable_images = request.config.getoption("--disable-images") or config.get("disable_images", False)
+    page_load_strategy = config.get("page_load_strategy", "eager")
+    _, drv, cleanup = create_selenium_driver(
+        headless=headless,
+        implicit_wait=implicit_wait,
+        disable_images=disable_images,
+        page_load_strategy=page_load_strategy,
+    )
     yield drv
     try:
         cleanup()
@@ -179,6 +221,15 @@ def driver(config):
         pass
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """
+    With ALUMNIUM_REUSE_CHROME set the shared Chrome is left running for the next session;
+    once reuse is switched off, shut down whatever a previous run left behind.
+    """
+    if not os.getenv(REUSE_ENV):
+        stop_shared_chrome()
+
+
 # ReportPortal logger setup (best effort). Uses pytest-reportportal RPLogger if available.
 try:
     from pytest_reportportal import RPLogger, RPLogHandler
@@ -209,14 +260,13 @@ def rp_logger(request):
     return logger
 
 
-# Wrap Alumni with the robust wrapper (retries / timeout / backoff)
-@pytest.fixture(scope="session")
-def al(driver, config, rp_logger):
-    """
-    Initialize Alumnium Alumni instance bound to Selenium driver, and wrap it with AlumniWrapper
-    to add retries / timeout / backoff behavior. Requires libs/al_wrapper.py to be present.
-    """
-    # Import here so LLM env vars (set in config()) are applied before Alumnium import.
+# AlumniWrapper instances built for this pytest run, keyed by id(driver)
+_AL_KEY = pytest.StashKey[Dict[int, Any]]()
+
+
+@functools.cache
+def _get_alumni_cls():
+    """Import alumnium.Alumni once per process (the import is heavy)."""
     try:
         from alumnium import Alumni
     except Exception as exc:
@@ -225,6 +275,24 @@ def al(driver, config, rp_logger):
             "Failed to import `alumnium`. Ensure the package is installed and package data (prompts) are present. "
             "Try: pip install --no-cache-dir --force-reinstall alumnium"
         ) from exc
+    return Alumni
+
+
+# Wrap Alumni with the robust wrapper (retries / timeout / backoff)
+@pytest.fixture(scope="session")
+def al(request, driver, config, rp_logger):
+    """
+    Initialize Alumnium Alumni instance bound to Selenium driver, and wrap it with AlumniWrapper
+    to add retries / timeout / backoff behavior. Requires libs/al_wrapper.py to be present.
+    The wrapper is stored on the pytest config stash, so it is built once per driver.
+    """
+    wrappers = request.config.stash.setdefault(_AL_KEY, {})
+    wrapper = wrappers.get(id(driver))
+    if wrapper is not None:
+        return wrapper
+
+    # Memoized import; the LLM env vars Alumnium reads were already exported by pytest_configure.
+    Alumni = _get_alumni_cls()
 
     # instantiate raw alumni
     alumni = Alumni(driver)
@@ -249,6 +317,7 @@ def al(driver, config, rp_logger):
         retry_backoff=retry_backoff,
         rp_logger=rp_logger,
     )
+    wrappers[id(driver)] = wrapper
     return wrapper
 
 
@@ -262,19 +331,30 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
 
-    if rep.when == "call" and rep.failed:
-        driver_fixture = item.funcargs.get("driver")
-        if driver_fixture:
-            try:
-                data = screenshot_bytes_from_selenium(driver_fixture)
-                rp_service = getattr(item.config, "py_test_service", None)
-                if rp_service:
-                    rp_service.post_log(
-                        item.name,
-                        "ERROR",
-                        message="Failure screenshot",
-                        attachment={"name": "screenshot.png", "data": data},
-                    )
-            except Exception:
-                # Never fail the test run because screenshot logic failed
-                logging.getLogger("framework").exception("Failed to capture/post screenshot for failed test.")
+    if rep.when != "call" or not rep.failed:
+        return
+    # no ReportPortal attached -> nothing to post, so don't pay for a screenshot
+    rp_service = getattr(item.config, "py_test_service", None)
+    if not rp_service:
+        return
+    driver_fixture = item.funcargs.get("driver")
+    if not driver_fixture:
+        return
+
+    try:
+        data = screenshot_bytes_from_selenium(driver_fixture, fmt="jpeg")
+        # non-Chromium drivers fall back to PNG
+        if data.startswith(b"\x89PNG"):
+            name, mime = "screenshot.png", "image/png"
+        else:
+            name, mime = "screenshot.jpg", "image/jpeg"
+        # pytest-reportportal 5.x: post_log(test_item, message, log_level="INFO", attachment=None)
+        rp_service.post_log(
+            item,
+            "Failure screenshot",
+            log_level="ERROR",
+            attachment={"name": name, "data": data, "mime": mime},
+        )
+    except Exception:
+        # Never fail the test run because screenshot logic failed
+        logging.getLogger("framework").exception("Failed to capture/post screenshot for failed test.")
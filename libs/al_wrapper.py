@@ -1,10 +1,26 @@
 # libs/al_wrapper.py
-import time
+import inspect
 import logging
-from typing import Any
+from typing import Any, Dict, Tuple
+
+from libs.retrier import Retrier
 
 logger = logging.getLogger("framework.alumnium")
 
+# results that are always considered usable as-is
+_PRIMITIVE = (str, bytes, int, float, bool)
+# attributes through which LLM response objects usually carry their content, in probe order
+_CONTENT_ATTRS = ("content", "text", "message", "choices")
+
+
+def _is_static_callable(obj: Any, name: str) -> bool:
+    """callable() check that looks the attribute up statically, so properties are never executed."""
+    try:
+        attr = inspect.getattr_static(obj, name)
+    except AttributeError:
+        return False
+    return callable(attr) or isinstance(attr, (staticmethod, classmethod))
+
 class AlumniWrapper:
     """
     Wrap an Alumni instance to add:
@@ -19,15 +35,24 @@ class AlumniWrapper:
         self.max_retries = int(max_retries)
         self.retry_backoff = float(retry_backoff)
         self.rp_logger = rp_logger or logger
-
-    def _log(self, level, msg, *args, **kwargs):
-        try:
-            if self.rp_logger:
-                # rp_logger can be RPLogger or standard logger
-                getattr(self.rp_logger, level)(msg, *args, **kwargs)
-        except Exception:
-            # fallback to module logger
-            getattr(logger, level)(msg, *args, **kwargs)
+        # name -> retrying proxy bound to the already-resolved Alumni method
+        self._method_cache = {}
+        # public callables of the Alumni instance that __getattr__ may proxy (fast path; found
+        # without evaluating properties, which may raise or have side effects)
+        self._proxy_methods = frozenset(
+            n for n in dir(alumni) if not n.startswith("_") and _is_static_callable(alumni, n)
+        )
+        # response type -> content attributes declared on the class (properties, slots, class attrs)
+        self._response_field_cache: Dict[type, Tuple[str, ...]] = {}
+        # retry plan (deadline, backoff schedule, usability check) shared by every proxied call
+        self._retrier = Retrier.exponential(
+            self.timeout_seconds,
+            self.max_retries,
+            self.retry_backoff,
+            is_usable=self._is_usable_response,
+            # rp_logger can be RPLogger or standard logger
+            logger=self.rp_logger,
+        )
 
     def _is_usable_response(self, res: Any) -> bool:
         """
@@ -38,73 +63,63 @@ class AlumniWrapper:
         if res is None:
             return False
         # direct primitive results
-        if isinstance(res, (str, bytes, int, float, bool)):
+        if isinstance(res, _PRIMITIVE):
+            return True
+        # content attributes declared on the class are the same for every instance: probe once per type
+        cls = type(res)
+        fields = self._response_field_cache.get(cls)
+        if fields is None:
+            fields = tuple(attr for attr in _CONTENT_ATTRS if hasattr(cls, attr))
+            self._response_field_cache[cls] = fields
+        # plain instance attributes vary per object, so check those directly
+        d = getattr(res, "__dict__", None)
+        if d:
+            fields += tuple(attr for attr in _CONTENT_ATTRS if attr in d and attr not in fields)
+        if not fields:
+            # otherwise be conservative and consider it usable
+            return True
+        try:
+            return any(getattr(res, attr, None) for attr in fields)
+        except Exception:
             return True
-        # check common attributes that carriers of content expose
-        for attr in ("content", "text", "message", "choices"):
-            try:
-                val = getattr(res, attr, None)
-            except Exception:
-                val = None
-            if val:
-                return True
-        # otherwise be conservative and consider it usable if it's not explicitly falsy
-        return True
-
-    def _call_with_retries(self, method_name: str, *args, **kwargs):
-        start = time.monotonic()
-        attempt = 0
-        backoff = float(self.retry_backoff)
-
-        while True:
-            attempt += 1
-            elapsed = time.monotonic() - start
-            if elapsed > self.timeout_seconds:
-                self._log("error", "Alumnium wrapper: total timeout %ss exceeded after %d attempts", self.timeout_seconds, attempt-1)
-                raise TimeoutError(f"Alumnium call exceeded total timeout of {self.timeout_seconds} seconds")
 
-            try:
-                self._log("debug", "Alumnium wrapper: attempt %d for %s", attempt, method_name)
-                method = getattr(self._alumni, method_name)
-                res = method(*args, **kwargs)
-            except Exception as exc:
-                self._log("warning", "Alumnium wrapper: exception on attempt %d: %s", attempt, exc)
-                if attempt >= self.max_retries:
-                    self._log("error", "Alumnium wrapper: exhausted retries (%d) for %s due to exceptions", self.max_retries, method_name)
-                    raise
-                # sleep then retry (exponential backoff)
-                time.sleep(backoff)
-                backoff *= 2
-                continue
+    def _proxy(self, name: str):
+        """Return (and cache) a retrying wrapper around self._alumni.<name>."""
+        proxy = self._method_cache.get(name)
+        if proxy is None:
+            method = getattr(self._alumni, name)
+            label = f"Alumnium wrapper: {name}"
+            run = self._retrier.run
 
-            # If result is unusable (None or missing content), retry
-            if not self._is_usable_response(res):
-                self._log("warning", "Alumnium wrapper: unusable (None/empty) response on attempt %d for %s", attempt, method_name)
-                if attempt >= self.max_retries:
-                    self._log("error", "Alumnium wrapper: exhausted retries (%d) for %s; last result unusable", self.max_retries, method_name)
-                    raise RuntimeError(f"Alumnium returned unusable response after {self.max_retries} attempts")
-                time.sleep(backoff)
-                backoff *= 2
-                continue
+            def proxy(*args, **kwargs):
+                return run(label, method, *args, **kwargs)
 
-            # Good response — return it
-            return res
+            self._method_cache[name] = proxy
+        return proxy
 
     # convenience methods — proxy commonly used calls
     def do(self, *args, **kwargs):
-        return self._call_with_retries("do", *args, **kwargs)
+        return self._proxy("do")(*args, **kwargs)
 
     def check(self, *args, **kwargs):
-        return self._call_with_retries("check", *args, **kwargs)
+        return self._proxy("check")(*args, **kwargs)
 
     def get(self, *args, **kwargs):
-        return self._call_with_retries("get", *args, **kwargs)
+        return self._proxy("get")(*args, **kwargs)
 
     # generic proxy: allows direct attribute access for other Alumni methods
     def __getattr__(self, name):
-        # If a direct method exists on Alumni, return a wrapper that will call it with retries.
-        if hasattr(self._alumni, name):
-            def _method(*args, **kwargs):
-                return self._call_with_retries(name, *args, **kwargs)
-            return _method
+        # guard against recursion before __init__ has set these (e.g. copy/pickle)
+        if name in ("_alumni", "_method_cache", "_proxy_methods"):
+            raise AttributeError(name)
+        # If a public method exists on Alumni, return a wrapper that will call it with retries.
+        if name in self._proxy_methods:
+            return self._proxy(name)
+        # slow path for names the static scan can't see (e.g. provided by Alumni.__getattr__)
+        try:
+            has_method = callable(getattr(self._alumni, name))
+        except Exception:
+            has_method = False
+        if has_method:
+            return self._proxy(name)
         raise AttributeError(name)
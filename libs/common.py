@@ -1,21 +1,33 @@
-import time
-from selenium.common.exceptions import NoSuchElementException
+import base64
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 def wait_and_click(driver, by, locator, timeout=10):
-    end = time.time() + timeout
-    while time.time() < end:
-        try:
-            el = driver.find_element(by, locator)
-            el.click()
-            return True
-        except Exception:
-            time.sleep(0.5)
-    raise NoSuchElementException(f"Could not click {locator}")
+    try:
+        el = WebDriverWait(driver, timeout, poll_frequency=0.2).until(EC.element_to_be_clickable((by, locator)))
+    except TimeoutException as exc:
+        raise NoSuchElementException(f"Could not click {locator}") from exc
+    el.click()
+    return True
 
 def element_text(driver, by, locator):
     el = driver.find_element(by, locator)
     return el.text
 
-def screenshot_bytes_from_selenium(driver):
-    """Return PNG bytes for the current page (Selenium)."""
+def screenshot_bytes_from_selenium(driver, fmt="jpeg"):
+    """
+    Return screenshot bytes for the current page (Selenium).
+    Chromium drivers capture via CDP Page.captureScreenshot in `fmt` ("jpeg" at quality 60, or "png");
+    other drivers fall back to get_screenshot_as_png(), so callers should not assume the format.
+    """
+    execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp_cmd is not None:
+        params = {"format": fmt, "captureBeyondViewport": False}
+        if fmt == "jpeg":
+            params["quality"] = 60
+        try:
+            return base64.b64decode(execute_cdp_cmd("Page.captureScreenshot", params)["data"])
+        except Exception:
+            pass
     return driver.get_screenshot_as_png()
@@ -0,0 +1,67 @@
+# libs/fast_config.py
+import re
+from pathlib import Path
+from typing import Dict, Iterator, Union
+
+SECTION_RE = re.compile(r"^\s*\[([^\]]+)\]\s*$")
+KV_RE = re.compile(r"^\s*([^=:;#\s][^=:]*?)\s*[:=]\s*(.*?)\s*$")
+
+DEFAULT_SECTION = "DEFAULT"
+
+
+class FastConfigParser:
+    """
+    Minimal INI reader for flat key/value config files such as config.ini.
+
+    Mirrors the subset of configparser.ConfigParser used by the framework:
+      - read(path), `name in cfg`, cfg[name] -> dict
+      - keys are lower-cased, values are stripped strings
+      - [DEFAULT] values are visible from every other section
+    No interpolation and no multi-line values.
+    """
+
+    def __init__(self):
+        self._sections: Dict[str, Dict[str, str]] = {DEFAULT_SECTION: {}}
+
+    def read(self, path: Union[str, Path]) -> "FastConfigParser":
+        try:
+            with open(path, encoding="utf-8") as fh:
+                self.read_string(fh.read())
+        except FileNotFoundError:
+            # same as ConfigParser.read: silently ignore missing files
+            pass
+        return self
+
+    def read_string(self, text: str) -> "FastConfigParser":
+        sections = self._sections
+        current = sections[DEFAULT_SECTION]
+        for line in text.splitlines():
+            m = SECTION_RE.match(line)
+            if m:
+                current = sections.setdefault(m.group(1).strip(), {})
+                continue
+            m = KV_RE.match(line)
+            if m:
+                current[m.group(1).lower()] = m.group(2)
+        return self
+
+    def as_dict(self) -> Dict[str, Dict[str, str]]:
+        """Return every section (DEFAULT included) with defaults merged in."""
+        return {name: self[name] for name in self._sections}
+
+    def sections(self):
+        return [name for name in self._sections if name != DEFAULT_SECTION]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sections
+
+    def __getitem__(self, name: str) -> Dict[str, str]:
+        section = self._sections[name]
+        if name == DEFAULT_SECTION:
+            return dict(section)
+        merged = dict(self._sections[DEFAULT_SECTION])
+        merged.update(section)
+        return merged
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
@@ -0,0 +1,100 @@
+# libs/retrier.py
+import time
+import logging
+from typing import Any, Callable, Optional, Sequence, Tuple, Type
+
+_module_logger = logging.getLogger("framework.retry")
+
+# upper bound for a single backoff sleep between retries
+MAX_BACKOFF = 60.0
+
+
+def _is_not_none(res: Any) -> bool:
+    return res is not None
+
+
+class Retrier:
+    """
+    Retry plan built once and reused for every call:
+      - deadline_sec: total time budget for one run(), checked before each attempt
+      - sleeps: backoff before retry N is sleeps[N-1]; len(sleeps) + 1 attempts in total
+      - retry_on: exception types that trigger a retry (anything else propagates)
+      - is_usable: predicate on the result; falsy means retry
+      - logger: where attempts/failures are logged (a logging.Logger or RPLogger)
+    """
+
+    __slots__ = ("deadline_sec", "sleeps", "retry_on", "is_usable", "logger", "_log_fns")
+
+    def __init__(
+        self,
+        deadline_sec: float,
+        sleeps: Sequence[float],
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        is_usable: Optional[Callable[[Any], bool]] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.deadline_sec = float(deadline_sec)
+        self.sleeps = tuple(sleeps)
+        self.retry_on = retry_on
+        self.is_usable = is_usable or _is_not_none
+        self.logger = logger or _module_logger
+        # level name -> bound logging method, resolved once (module logger for missing levels)
+        self._log_fns = {
+            lvl: getattr(self.logger, lvl, getattr(_module_logger, lvl)) for lvl in ("debug", "warning", "error")
+        }
+
+    def _log(self, level: str, msg: str, *args, **kwargs) -> None:
+        try:
+            self._log_fns[level](msg, *args, **kwargs)
+        except Exception:
+            # fallback to module logger
+            getattr(_module_logger, level)(msg, *args, **kwargs)
+
+    def _tracebacks(self) -> bool:
+        """Attach tracebacks to retry warnings only when DEBUG is enabled (they are costly to format)."""
+        is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+        return bool(is_enabled_for and is_enabled_for(logging.DEBUG))
+
+    @classmethod
+    def exponential(cls, deadline_sec: float, max_retries: int, retry_backoff: float,
+                    max_backoff: float = MAX_BACKOFF, **kwargs) -> "Retrier":
+        """Up to max_retries attempts, sleeping retry_backoff * 2**i (capped at max_backoff) in between."""
+        sleeps = tuple(min(float(retry_backoff) * (2 ** i), max_backoff) for i in range(int(max_retries) - 1))
+        return cls(deadline_sec, sleeps, **kwargs)
+
+    def run(self, label: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call fn(*args, **kwargs) until it returns a usable result; label prefixes log/error messages."""
+        log = self._log
+        sleeps = self.sleeps
+        attempts = len(sleeps) + 1
+        deadline = time.monotonic() + self.deadline_sec
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if time.monotonic() > deadline:
+                elapsed = self.deadline_sec - (deadline - time.monotonic())
+                log("error", "%s: total timeout %ss exceeded after %d attempts (%.1fs elapsed)",
+                    label, self.deadline_sec, attempt - 1, elapsed)
+                raise TimeoutError(f"{label} exceeded total timeout of {self.deadline_sec} seconds")
+
+            try:
+                log("debug", "%s: attempt %d", label, attempt)
+                res = fn(*args, **kwargs)
+            except self.retry_on as exc:
+                log("warning", "%s: exception on attempt %d: %s", label, attempt, exc, exc_info=self._tracebacks())
+                if attempt >= attempts:
+                    log("error", "%s: exhausted retries (%d) due to exceptions", label, attempts)
+                    raise
+                time.sleep(sleeps[attempt - 1])
+                continue
+
+            if self.is_usable(res):
+                return res
+
+            # unusable (None or missing content) -> retry
+            log("warning", "%s: unusable (None/empty) response on attempt %d", label, attempt)
+            if attempt >= attempts:
+                log("error", "%s: exhausted retries (%d); last result unusable", label, attempts)
+                raise RuntimeError(f"{label} returned unusable response after {attempts} attempts")
+            time.sleep(sleeps[attempt - 1])
@@ -0,0 +1,56 @@
+import configparser
+from pathlib import Path
+
+from libs.fast_config import FastConfigParser
+
+CONFIG_INI = Path(__file__).parent.parent / "config.ini"
+
+
+def test_shipped_config_matches_configparser():
+    fast = FastConfigParser().read(CONFIG_INI)
+    std = configparser.ConfigParser()
+    std.read(CONFIG_INI)
+
+    assert fast.sections() == std.sections()
+    for name in ["DEFAULT", *std.sections()]:
+        assert fast[name] == dict(std[name]), name
+
+
+def test_default_merged_into_sections():
+    cfg = FastConfigParser().read_string(
+        "[DEFAULT]\nheadless = false\nimplicit_wait = 5\n\n[ci]\nheadless = true\n"
+    )
+    assert cfg["ci"] == {"headless": "true", "implicit_wait": "5"}
+    assert cfg["DEFAULT"] == {"headless": "false", "implicit_wait": "5"}
+    assert "ci" in cfg
+    assert "local" not in cfg
+
+
+def test_comment_lines_ignored():
+    cfg = FastConfigParser().read_string(
+        "[llm]\n; semicolon comment\n# hash comment\n  # indented comment\nprovider = ollama\n"
+    )
+    assert cfg["llm"] == {"provider": "ollama"}
+
+
+def test_values_containing_separators():
+    cfg = FastConfigParser().read_string(
+        "[llm]\nollama_url = http://127.0.0.1:11434\nmodel: gemma3:4b\nquery = a=b\n"
+    )
+    assert cfg["llm"] == {
+        "ollama_url": "http://127.0.0.1:11434",
+        "model": "gemma3:4b",
+        "query": "a=b",
+    }
+
+
+def test_keys_lowercased_and_values_stripped():
+    cfg = FastConfigParser().read_string("[x]\n  Base_URL   =   https://duckduckgo.com   \n")
+    assert cfg["x"] == {"base_url": "https://duckduckgo.com"}
+
+
+def test_missing_file(tmp_path):
+    cfg = FastConfigParser().read(tmp_path / "nope.ini")
+    assert cfg.sections() == []
+    assert cfg["DEFAULT"] == {}
+    assert "llm" not in cfg
@@ -0,0 +1,125 @@
+import logging
+
+import pytest
+
+from libs import retrier as retrier_mod
+from libs.retrier import Retrier
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep: sleeping advances the clock instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(retrier_mod.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(retrier_mod.time, "sleep", fake.sleep)
+    return fake
+
+
+def sequence(*outcomes):
+    """Callable returning (or raising) each outcome in turn; records the call count."""
+    it = iter(outcomes)
+
+    def fn():
+        fn.calls += 1
+        out = next(it)
+        if isinstance(out, BaseException):
+            raise out
+        return out
+
+    fn.calls = 0
+    return fn
+
+
+def test_exponential_schedule_capped():
+    assert Retrier.exponential(600, 8, 5).sleeps == (5, 10, 20, 40, 60, 60, 60)
+    assert Retrier.exponential(600, 3, 2, max_backoff=3).sleeps == (2, 3)
+
+
+@pytest.mark.parametrize("max_retries", [0, 1, -2])
+def test_non_positive_max_retries_means_single_attempt(clock, max_retries):
+    r = Retrier.exponential(60, max_retries, 5)
+    assert r.sleeps == ()
+    fn = sequence(None)
+    with pytest.raises(RuntimeError):
+        r.run("op", fn)
+    assert fn.calls == 1
+    assert clock.sleeps == []
+
+
+def test_retries_on_none(clock):
+    fn = sequence(None, None, "ok")
+    assert Retrier.exponential(60, 3, 5).run("op", fn) == "ok"
+    assert fn.calls == 3
+    assert clock.sleeps == [5, 10]
+
+
+def test_retries_on_exception(clock):
+    fn = sequence(ValueError("boom"), "ok")
+    assert Retrier.exponential(60, 3, 5).run("op", fn) == "ok"
+    assert clock.sleeps == [5]
+
+
+def test_passes_arguments_through(clock):
+    assert Retrier.exponential(60, 3, 5).run("op", lambda a, b=0: a + b, 1, b=2) == 3
+
+
+def test_exhausted_retries_reraises_last_exception(clock):
+    fn = sequence(ValueError("one"), ValueError("two"), ValueError("three"))
+    with pytest.raises(ValueError, match="three"):
+        Retrier.exponential(600, 3, 5).run("op", fn)
+    assert fn.calls == 3
+    assert clock.sleeps == [5, 10]
+
+
+def test_exhausted_retries_on_unusable_result(clock):
+    r = Retrier.exponential(600, 3, 5, is_usable=bool)
+    with pytest.raises(RuntimeError, match=r"^op returned unusable response after 3 attempts$"):
+        r.run("op", sequence("", "", ""))
+    assert clock.sleeps == [5, 10]
+
+
+def test_exception_not_in_retry_on_propagates_immediately(clock):
+    fn = sequence(KeyError("k"), "ok")
+    with pytest.raises(KeyError):
+        Retrier.exponential(60, 3, 5, retry_on=(ValueError,)).run("op", fn)
+    assert fn.calls == 1
+    assert clock.sleeps == []
+
+
+def test_total_timeout(clock):
+    # attempt 1 at t=0, sleep 5; attempt 2 at t=5, sleep 10; t=15 > 12 -> timeout before attempt 3
+    fn = sequence(ValueError("a"), ValueError("b"), "never reached")
+    with pytest.raises(TimeoutError, match=r"^op exceeded total timeout of 12.0 seconds$"):
+        Retrier.exponential(12, 5, 5).run("op", fn)
+    assert fn.calls == 2
+    assert clock.sleeps == [5, 10]
+
+
+def test_logs_to_given_logger_with_tracebacks_only_at_debug(clock, caplog):
+    log = logging.getLogger("tests.retrier")
+
+    caplog.set_level(logging.WARNING, logger="tests.retrier")
+    Retrier.exponential(60, 2, 5, logger=log).run("op", sequence(ValueError("boom"), "ok"))
+    [warning] = [rec for rec in caplog.records if rec.name == "tests.retrier"]
+    assert warning.getMessage() == "op: exception on attempt 1: boom"
+    assert not warning.exc_info
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="tests.retrier")
+    Retrier.exponential(60, 2, 5, logger=log).run("op", sequence(ValueError("boom"), "ok"))
+    [warning] = [rec for rec in caplog.records if rec.levelno == logging.WARNING]
+    assert warning.exc_info
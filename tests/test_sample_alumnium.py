@@ -4,7 +4,9 @@ def test_duckduckgo_search(al, driver, rp_logger, config):
     rp_logger.info("Start test: duckduckgo search via Alumnium")
 
     base = config.get("base_url", "https://duckduckgo.com")
-    # navigate using Selenium driver (Alumnium typically relies on driver state)
+    # navigate using Selenium driver (Alumnium typically relies on driver state).
+    # The driver uses the "eager" page load strategy, so this returns at DOMContentLoaded;
+    # Alumnium waits for the page to settle before acting on it.
     driver.get(base)
 
     # Use Alumnium high-level commands
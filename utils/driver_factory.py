@@ -2,19 +2,208 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from typing import Tuple
+from pathlib import Path
+from typing import List, Optional, Tuple
+import json
+import logging
 import os
+import signal
+import socket
 import stat
 import shutil
+import subprocess
+import tempfile
+import time
 
-def create_selenium_driver(headless: bool = True, implicit_wait: int = 5) -> Tuple[str, object, callable]:
-    opts = Options()
+logger = logging.getLogger("framework.driver")
+
+# Set ALUMNIUM_REUSE_CHROME=1 to keep one Chrome alive across sessions and attach to it.
+REUSE_ENV = "ALUMNIUM_REUSE_CHROME"
+SHARED_PROFILE_DIR = Path(tempfile.gettempdir()) / "alum-profile"
+# Chrome writes the debugging port it actually bound here when started with --remote-debugging-port=0
+DEVTOOLS_PORT_FILE = SHARED_PROFILE_DIR / "DevToolsActivePort"
+# holds {"port": ..., "pid": ..., "args": [...]} of the shared Chrome
+SHARED_LOCKFILE = Path(tempfile.gettempdir()) / "alum-profile.lock"
+
+_CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+
+def _chrome_args(headless: bool, disable_images: bool = False) -> List[str]:
+    args = []
     if headless:
         # modern headless mode
-        opts.add_argument("--headless=new")
-        opts.add_argument("--no-sandbox")
-    opts.add_argument("--window-size=1920,1080")
-    opts.add_argument("--disable-dev-shm-usage")
+        args.append("--headless=new")
+        args.append("--no-sandbox")
+        # skip subsystems a headless test run never uses (faster startup, less memory)
+        args.extend([
+            "--disable-gpu",
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-default-apps",
+            "--disable-features=TranslateUI,VizDisplayCompositor",
+            "--disable-sync",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ])
+    if disable_images:
+        # only for tests that don't depend on rendered images
+        args.append("--blink-settings=imagesEnabled=false")
+    args.append("--window-size=1920,1080")
+    args.append("--disable-dev-shm-usage")
+    return args
+
+
+def _find_chrome_binary() -> str:
+    binary = os.getenv("ALUMNIUM_CHROME_BINARY")
+    if binary:
+        return binary
+    for name in _CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise RuntimeError(f"{REUSE_ENV} is set but no Chrome binary was found; set ALUMNIUM_CHROME_BINARY.")
+
+
+def _port_open(port: int) -> bool:
+    try:
+        with socket.create_connection(("localhost", port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def _read_lockfile() -> Optional[dict]:
+    """Return {"port", "pid", "args"} from the lockfile, or None if it is missing or malformed."""
+    try:
+        lock = json.loads(SHARED_LOCKFILE.read_text())
+        return {"port": int(lock["port"]), "pid": int(lock["pid"]), "args": list(lock["args"])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _read_devtools_port() -> Optional[int]:
+    """Port our Chrome bound, from the first line of <profile>/DevToolsActivePort."""
+    try:
+        return int(DEVTOOLS_PORT_FILE.read_text().splitlines()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _is_shared_chrome(lock: dict) -> bool:
+    """
+    True only if the lockfile still points at the Chrome we started: its debugging port answers
+    and the pid's cmdline carries our --user-data-dir. A stale lock (reboot, crash) may name a
+    pid that now belongs to an unrelated process.
+    """
+    pid = lock["pid"]
+    if not _port_open(lock["port"]):
+        return False
+    try:
+        cmdline = Path(f"/proc/{pid}/cmdline").read_bytes().split(b"\0")
+    except OSError:
+        # no /proc (e.g. macOS): start_new_session made our Chrome its own process group leader
+        try:
+            return os.getpgid(pid) == pid
+        except OSError:
+            return False
+    return f"--user-data-dir={SHARED_PROFILE_DIR}".encode() in cmdline
+
+
+def _ensure_shared_chrome(args: List[str], startup_timeout: float = 15.0) -> int:
+    """Return the debugging port of the shared Chrome, starting (or restarting) it as needed."""
+    lock = _read_lockfile()
+    if lock and _is_shared_chrome(lock):
+        if lock["args"] == args:
+            return lock["port"]
+        # headless/disable_images etc. only apply at launch; restart rather than silently ignore them
+        logger.warning("Shared Chrome was started with different arguments; restarting it.")
+        stop_shared_chrome()
+
+    SHARED_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        # a leftover file from a previous browser would report a stale port
+        DEVTOOLS_PORT_FILE.unlink()
+    except FileNotFoundError:
+        pass
+    proc = subprocess.Popen(
+        # port 0: let Chrome pick a free port, so we never attach to someone else's browser on 9222
+        [_find_chrome_binary(), "--remote-debugging-port=0", f"--user-data-dir={SHARED_PROFILE_DIR}", *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        # detach so the browser outlives this pytest process
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + startup_timeout
+    while True:
+        port = _read_devtools_port()
+        if port is not None and _port_open(port):
+            break
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            raise RuntimeError(f"Shared Chrome did not open a debugging port within {startup_timeout}s")
+        time.sleep(0.1)
+
+    SHARED_LOCKFILE.write_text(json.dumps({"port": port, "pid": proc.pid, "args": args}))
+    return port
+
+
+def stop_shared_chrome(exit_timeout: float = 5.0) -> None:
+    """Terminate the shared Chrome recorded in the lockfile (if it is still ours) and remove the lockfile."""
+    lock = _read_lockfile()
+    if lock and _is_shared_chrome(lock):
+        try:
+            # the whole process group created by start_new_session (browser + renderers)
+            os.killpg(lock["pid"], signal.SIGTERM)
+        except OSError:
+            pass
+        # wait for it to release the profile dir, or a relaunch would just hand off to it
+        deadline = time.monotonic() + exit_timeout
+        while _pid_alive(lock["pid"]) and time.monotonic() < deadline:
+            try:
+                # reap it if this process launched it, so it doesn't linger as a zombie
+                os.waitpid(lock["pid"], os.WNOHANG)
+            except ChildProcessError:
+                pass
+            time.sleep(0.1)
+    try:
+        SHARED_LOCKFILE.unlink()
+    except OSError:
+        # missing, or owned by another user in a sticky /tmp; never break the session over it
+        pass
+
+
+def create_selenium_driver(headless: bool = True, implicit_wait: int = 5,
+                           disable_images: bool = False,
+                           page_load_strategy: str = "eager") -> Tuple[str, object, callable]:
+    opts = Options()
+    # "eager" returns from driver.get() at DOMContentLoaded instead of waiting for every
+    # image/beacon; pass "normal" for tests that need the full load event.
+    opts.page_load_strategy = page_load_strategy
+    args = _chrome_args(headless, disable_images=disable_images)
+
+    if os.getenv(REUSE_ENV):
+        # attach to the warm browser instead of spawning a new one
+        port = _ensure_shared_chrome(args)
+        opts.debugger_address = f"localhost:{port}"
+        driver = webdriver.Chrome(options=opts)
+        driver.implicitly_wait(int(implicit_wait))
+
+        def cleanup():
+            # keep the shared browser alive for the next session
+            pass
+
+        return ("selenium", driver, cleanup)
+
+    for arg in args:
+        opts.add_argument(arg)
     # Let Selenium Manager handle driver resolution (Selenium >= 4.10)
     driver = webdriver.Chrome(options=opts)
     driver.implicitly_wait(int(implicit_wait))